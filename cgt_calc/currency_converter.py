@@ -5,11 +5,12 @@ from __future__ import annotations
 from collections import defaultdict
 import csv
 import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Final
 from xml.etree import ElementTree
 
+import pandas as pd
 import requests
 
 from .dates import is_date
@@ -29,11 +30,12 @@ class CurrencyConverter:
     ):
         """Load data from exchange_rates_file and optionally from initial_data."""
         self.exchange_rates_file = exchange_rates_file
-        read_data = self._read_exchange_rates_file(exchange_rates_file)
-        self.cache: dict[datetime.date, dict[str, Decimal]] = {
-            **read_data,
-            **(initial_data or {}),
-        }
+        # HMRC publishes monthly rates, so everything is keyed by the 1st of month
+        self.cache: dict[datetime.date, dict[str, Decimal]] = dict(
+            self._read_exchange_rates_file(exchange_rates_file)
+        )
+        for date, rates in (initial_data or {}).items():
+            self.cache.setdefault(date.replace(day=1), {}).update(rates)
         self.session = requests.Session()
 
     @staticmethod
@@ -46,20 +48,25 @@ class CurrencyConverter:
         path = Path(exchange_rates_file)
         if not path.is_file():
             return cache
-        with path.open(encoding="utf8") as fin:
-            csv_reader = csv.DictReader(fin)
-            # skip the header
-            next(csv_reader)
-            for line in csv_reader:
-                if sorted(EXCHANGE_RATES_HEADER) != sorted(line.keys()):
-                    raise ParsingError(
-                        exchange_rates_file,
-                        f"invalid columns {line.keys()}, "
-                        f"they should be {EXCHANGE_RATES_HEADER}",
-                    )
-                date = datetime.date.fromisoformat(line["month"])
-                cache[date][line["currency"]] = Decimal(line["rate"])
-            return cache
+        rates_table = pd.read_csv(path, dtype=str, keep_default_na=False)
+        if sorted(EXCHANGE_RATES_HEADER) != sorted(rates_table.columns):
+            raise ParsingError(
+                exchange_rates_file,
+                f"invalid columns {list(rates_table.columns)}, "
+                f"they should be {EXCHANGE_RATES_HEADER}",
+            )
+        for month_str, currency, rate in zip(
+            rates_table["month"], rates_table["currency"], rates_table["rate"]
+        ):
+            try:
+                month = datetime.date.fromisoformat(month_str).replace(day=1)
+                cache[month][currency] = Decimal(rate)
+            except (ValueError, InvalidOperation):
+                raise ParsingError(
+                    exchange_rates_file,
+                    f"invalid row {month_str},{currency},{rate}",
+                ) from None
+        return cache
 
     @staticmethod
     def _write_exchange_rates_file(
@@ -76,16 +83,16 @@ class CurrencyConverter:
             writer = csv.writer(fout)
             writer.writerows([EXCHANGE_RATES_HEADER, *data_rows])
 
-    def _query_hmrc_api(self, date: datetime.date) -> None:
+    def _query_hmrc_api(self, month: datetime.date) -> None:
         # Pre 2021 we need to use the old HMRC endpoint
-        if date.year < 2021:
-            month_str = date.strftime("%m%y")
+        if month.year < 2021:
+            month_str = month.strftime("%m%y")
             url = (
                 "http://www.hmrc.gov.uk/softwaredevelopers/rates/"
                 f"exrates-monthly-{month_str}.xml"
             )
         else:
-            month_str = date.strftime("%Y-%m")
+            month_str = month.strftime("%Y-%m")
             url = (
                 "https://www.trade-tariff.service.gov.uk/api/v2/"
                 f"exchange_rates/files/monthly_xml_{month_str}.xml"
@@ -99,25 +106,27 @@ class CurrencyConverter:
             )
 
         tree = ElementTree.fromstring(response.text)
-        rates = {
-            str(getattr(row.find("currencyCode"), "text", None)).upper(): Decimal(
-                str(getattr(row.find("rateNew"), "text", None))
-            )
-            for row in tree
-        }
-        if None in rates or None in rates.values():
-            raise ParsingError(url, "HMRC API produced invalid/unknown data")
-        self.cache[date] = rates
+        rates = {}
+        for row in tree:
+            currency = row.findtext("currencyCode")
+            rate = row.findtext("rateNew")
+            if currency is None or rate is None:
+                raise ParsingError(url, "HMRC API produced invalid/unknown data")
+            rates[currency.upper()] = Decimal(rate)
+        self.cache[month] = rates
         self._write_exchange_rates_file(self.exchange_rates_file, self.cache)
 
     def currency_to_gbp_rate(self, currency: str, date: datetime.date) -> Decimal:
         """Get GBP/currency rate at given date."""
         assert is_date(date)
-        if date not in self.cache:
-            self._query_hmrc_api(date)
-        if currency not in self.cache[date]:
+        month = date.replace(day=1)
+        rates = self.cache.get(month)
+        if rates is None:
+            self._query_hmrc_api(month)
+            rates = self.cache[month]
+        if currency not in rates:
             raise ExchangeRateMissingError(currency, date)
-        return self.cache[date][currency]
+        return rates[currency]
 
     def to_gbp(self, amount: Decimal, currency: str, date: datetime.date) -> Decimal:
         """Convert amount from given currency to GBP."""
@@ -127,5 +136,8 @@ class CurrencyConverter:
 
     def to_gbp_for(self, amount: Decimal, transaction: BrokerTransaction) -> Decimal:
         """Convert amount from transaction currency to GBP."""
-
-        return self.to_gbp(amount, transaction.currency, transaction.date)
+        # Inlined to_gbp(), this is called several times for every transaction
+        currency = transaction.currency
+        if currency == "GBP":
+            return amount
+        return amount / self.currency_to_gbp_rate(currency.upper(), transaction.date)
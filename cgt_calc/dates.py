@@ -20,3 +20,19 @@ def get_tax_year_end(tax_year: int) -> datetime.date:
     """Return tax year end date."""
     # 5 April
     return datetime.date(tax_year + 1, 4, 5)
+
+
+def parse_slash_date(date_str: str, day_first: bool = False) -> datetime.date:
+    """Parse a MM/DD/YYYY date, or DD/MM/YYYY if day_first is set."""
+    fields = date_str.split("/")
+    if (
+        len(fields) != 3
+        or not all(field.isascii() and field.isdigit() for field in fields)
+        or not 1 <= len(fields[0]) <= 2
+        or not 1 <= len(fields[1]) <= 2
+        or len(fields[2]) != 4
+    ):
+        raise ValueError(f'invalid date: "{date_str}"')
+    first, second, year = fields
+    month, day = (second, first) if day_first else (first, second)
+    return datetime.date(int(year), int(month), int(day))
@@ -19,6 +19,7 @@ class InitialPrices:
     def get(self, date: datetime.date, symbol: str) -> Decimal:
         """Get initial stock price at given date."""
         assert is_date(date)
-        if date not in self.initial_prices or symbol not in self.initial_prices[date]:
+        price = self.initial_prices.get(date, {}).get(symbol)
+        if price is None:
             raise ExchangeRateMissingError(symbol, date)
-        return self.initial_prices[date][symbol]
+        return price
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import astuple
 import datetime
 import decimal
 from decimal import Decimal
@@ -11,12 +10,13 @@ import importlib.metadata
 import logging
 from pathlib import Path
 import sys
+from typing import Final
 
 from . import render_latex
 from .args_parser import create_parser
 from .const import BED_AND_BREAKFAST_DAYS, CAPITAL_GAIN_ALLOWANCES, INTERNAL_START_DATE
 from .currency_converter import CurrencyConverter
-from .dates import get_tax_year_end, get_tax_year_start, is_date
+from .dates import get_tax_year_end, get_tax_year_start
 from .exceptions import (
     AmountMissingError,
     CalculatedAmountDiscrepancyError,
@@ -34,14 +34,26 @@ from .model import (
     CalculationLog,
     CapitalGainsReport,
     HmrcTransactionLog,
+    Position,
     RuleType,
 )
 from .parsers import read_broker_transactions, read_initial_prices
-from .transaction_log import add_to_list, has_key
+from .transaction_log import add_to_list
 from .util import round_decimal
 
 LOGGER = logging.getLogger(__name__)
 
+# Groups of actions which are handled the same way
+_BUY_ACTIONS: Final = frozenset({ActionType.BUY, ActionType.REINVEST_SHARES})
+_INITIAL_PRICE_ACTIONS: Final = frozenset(
+    {ActionType.STOCK_ACTIVITY, ActionType.SPIN_OFF}
+)
+_NON_CASH_ACQUISITION_ACTIONS: Final = frozenset(
+    {ActionType.STOCK_ACTIVITY, ActionType.SPIN_OFF, ActionType.STOCK_SPLIT}
+)
+_DIVIDEND_ACTIONS: Final = frozenset({ActionType.DIVIDEND, ActionType.CAPITAL_GAIN})
+_TAX_ACTIONS: Final = frozenset({ActionType.TAX, ActionType.ADJUSTMENT})
+
 
 def get_amount_or_fail(transaction: BrokerTransaction) -> Decimal:
     """Return the transaction amount or throw an error."""
@@ -53,8 +65,11 @@ def get_amount_or_fail(transaction: BrokerTransaction) -> Decimal:
 
 # It is not clear how Schwab or other brokers round the dollar value,
 # so assume the values are equal if they are within $0.01.
+_APPROX_EQUAL_TOLERANCE: Final = Decimal("0.01")
+
+
 def _approx_equal(val_a: Decimal, val_b: Decimal) -> bool:
-    return abs(val_a - val_b) < Decimal("0.01")
+    return -_APPROX_EQUAL_TOLERANCE < val_a - val_b < _APPROX_EQUAL_TOLERANCE
 
 
 class CapitalGainsCalculator:
@@ -77,11 +92,6 @@ class CapitalGainsCalculator:
         self.initial_prices = initial_prices
         self.balance_check = balance_check
 
-    def date_in_tax_year(self, date: datetime.date) -> bool:
-        """Check if date is within current tax year."""
-        assert is_date(date)
-        return self.tax_year_start_date <= date <= self.tax_year_end_date
-
     def add_acquisition(
         self,
         portfolio: dict[str, Decimal],
@@ -103,11 +113,11 @@ class CapitalGainsCalculator:
             portfolio[symbol] = quantity
 
         # Add to acquisition_list to apply same day rule
-        if transaction.action in [ActionType.STOCK_ACTIVITY, ActionType.SPIN_OFF]:
+        if transaction.action in _INITIAL_PRICE_ACTIONS:
             if price is None:
                 price = self.initial_prices.get(transaction.date, symbol)
             amount = round_decimal(quantity * price, 2)
-        elif transaction.action == ActionType.STOCK_SPLIT:
+        elif transaction.action is ActionType.STOCK_SPLIT:
             price = Decimal(0)
             amount = Decimal(0)
         else:
@@ -188,24 +198,26 @@ class CapitalGainsCalculator:
         portfolio: dict[str, Decimal] = {}
         acquisition_list: HmrcTransactionLog = {}
         disposal_list: HmrcTransactionLog = {}
+        tax_year_start_date = self.tax_year_start_date
+        tax_year_end_date = self.tax_year_end_date
 
         for i, transaction in enumerate(transactions):
-            new_balance = balance[(transaction.broker, transaction.currency)]
-            if transaction.action is ActionType.TRANSFER:
+            in_tax_year = tax_year_start_date <= transaction.date <= tax_year_end_date
+            action = transaction.action
+            balance_key = (transaction.broker, transaction.currency)
+            new_balance = balance[balance_key]
+            if action is ActionType.TRANSFER:
                 new_balance += get_amount_or_fail(transaction)
-            elif transaction.action in [
-                ActionType.BUY,
-                ActionType.REINVEST_SHARES,
-            ]:
+            elif action in _BUY_ACTIONS:
                 new_balance += get_amount_or_fail(transaction)
                 self.add_acquisition(portfolio, acquisition_list, transaction)
-            elif transaction.action is ActionType.SELL:
+            elif action is ActionType.SELL:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
                 self.add_disposal(portfolio, disposal_list, transaction)
-                if self.date_in_tax_year(transaction.date):
+                if in_tax_year:
                     total_sells += self.converter.to_gbp_for(amount, transaction)
-            elif transaction.action is ActionType.FEE:
+            elif action is ActionType.FEE:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
                 transaction.fees = -amount
@@ -221,35 +233,31 @@ class CapitalGainsCalculator:
                     gbp_fees,
                     gbp_fees,
                 )
-            elif transaction.action in [
-                ActionType.STOCK_ACTIVITY,
-                ActionType.SPIN_OFF,
-                ActionType.STOCK_SPLIT,
-            ]:
+            elif action in _NON_CASH_ACQUISITION_ACTIONS:
                 self.add_acquisition(portfolio, acquisition_list, transaction)
-            elif transaction.action in [ActionType.DIVIDEND, ActionType.CAPITAL_GAIN]:
+            elif action in _DIVIDEND_ACTIONS:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
-                if self.date_in_tax_year(transaction.date):
+                if in_tax_year:
                     dividends += self.converter.to_gbp_for(amount, transaction)
-            elif transaction.action in [ActionType.TAX, ActionType.ADJUSTMENT]:
+            elif action in _TAX_ACTIONS:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
-                if self.date_in_tax_year(transaction.date):
+                if in_tax_year:
                     dividends_tax += self.converter.to_gbp_for(amount, transaction)
-            elif transaction.action is ActionType.INTEREST:
+            elif action is ActionType.INTEREST:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
-                if self.date_in_tax_year(transaction.date):
+                if in_tax_year:
                     interest += self.converter.to_gbp_for(amount, transaction)
-            elif transaction.action is ActionType.WIRE_FUNDS_RECEIVED:
+            elif action is ActionType.WIRE_FUNDS_RECEIVED:
                 amount = get_amount_or_fail(transaction)
                 new_balance += amount
-            elif transaction.action is ActionType.REINVEST_DIVIDENDS:
-                print(f"WARNING: Ignoring unsupported action: {transaction.action}")
+            elif action is ActionType.REINVEST_DIVIDENDS:
+                print(f"WARNING: Ignoring unsupported action: {action}")
             else:
                 raise InvalidTransactionError(
-                    transaction, f"Action not processed({transaction.action})"
+                    transaction, f"Action not processed({action})"
                 )
             if self.balance_check and new_balance < 0:
                 msg = f"Reached a negative balance({new_balance})"
@@ -257,7 +265,7 @@ class CapitalGainsCalculator:
                 msg += " after processing the following transactions:\n"
                 msg += "\n".join(map(str, transactions[: i + 1]))
                 raise CalculationError(msg)
-            balance[(transaction.broker, transaction.currency)] = new_balance
+            balance[balance_key] = new_balance
         print("First pass completed")
         print("Final portfolio:")
         for stock, quantity in portfolio.items():
@@ -276,18 +284,21 @@ class CapitalGainsCalculator:
     def process_acquisition(
         acquisition_list: HmrcTransactionLog,
         bed_and_breakfast_list: HmrcTransactionLog,
-        portfolio: dict[str, tuple[Decimal, Decimal]],
+        portfolio: dict[str, Position],
         symbol: str,
         date_index: datetime.date,
     ) -> list[CalculationEntry]:
         """Process single acquisition."""
-        acquisition_quantity, acquisition_amount, acquisition_fees = astuple(
-            acquisition_list[date_index][symbol]
-        )
+        transaction = acquisition_list[date_index][symbol]
+        acquisition_quantity = transaction.quantity
+        acquisition_amount = transaction.amount
+        acquisition_fees = transaction.fees
         original_acquisition_amount = acquisition_amount
-        if symbol not in portfolio:
-            portfolio[symbol] = (Decimal(0), Decimal(0))
-        current_quantity, current_amount = portfolio[symbol]
+        position = portfolio.get(symbol)
+        if position is None:
+            position = portfolio[symbol] = Position(Decimal(0), Decimal(0))
+        current_quantity = position.quantity
+        current_amount = position.amount
         calculation_entries = []
 
         # Management fee transaction can have 0 quantity
@@ -299,12 +310,10 @@ class CapitalGainsCalculator:
         bed_and_breakfast_fees = Decimal(0)
         if acquisition_quantity > 0:
             acquisition_price = acquisition_amount / acquisition_quantity
-            if has_key(bed_and_breakfast_list, date_index, symbol):
-                (
-                    bed_and_breakfast_quantity,
-                    bed_and_breakfast_amount,
-                    _bed_and_breakfast_fees,
-                ) = astuple(bed_and_breakfast_list[date_index][symbol])
+            bed_and_breakfast = bed_and_breakfast_list.get(date_index, {}).get(symbol)
+            if bed_and_breakfast is not None:
+                bed_and_breakfast_quantity = bed_and_breakfast.quantity
+                bed_and_breakfast_amount = bed_and_breakfast.amount
                 assert bed_and_breakfast_quantity <= acquisition_quantity
                 acquisition_amount -= bed_and_breakfast_quantity * acquisition_price
                 acquisition_amount += bed_and_breakfast_amount
@@ -323,10 +332,8 @@ class CapitalGainsCalculator:
                         allowable_cost=original_acquisition_amount,
                     )
                 )
-        portfolio[symbol] = (
-            current_quantity + acquisition_quantity,
-            current_amount + acquisition_amount,
-        )
+        position.quantity = current_quantity + acquisition_quantity
+        position.amount = current_amount + acquisition_amount
         if (
             acquisition_quantity - bed_and_breakfast_quantity > 0
             or bed_and_breakfast_quantity == 0
@@ -349,25 +356,28 @@ class CapitalGainsCalculator:
         acquisition_list: HmrcTransactionLog,
         disposal_list: HmrcTransactionLog,
         bed_and_breakfast_list: HmrcTransactionLog,
-        portfolio: dict[str, tuple[Decimal, Decimal]],
+        portfolio: dict[str, Position],
         symbol: str,
         date_index: datetime.date,
     ) -> tuple[Decimal, list[CalculationEntry]]:
         """Process single disposal."""
-        disposal_quantity, proceeds_amount, disposal_fees = astuple(
-            disposal_list[date_index][symbol]
-        )
+        transaction = disposal_list[date_index][symbol]
+        disposal_quantity = transaction.quantity
+        proceeds_amount = transaction.amount
+        disposal_fees = transaction.fees
         original_disposal_quantity = disposal_quantity
         disposal_price = proceeds_amount / disposal_quantity
-        current_quantity, current_amount = portfolio[symbol]
+        position = portfolio[symbol]
+        current_quantity = position.quantity
+        current_amount = position.amount
         assert disposal_quantity <= current_quantity
         chargeable_gain = Decimal(0)
         calculation_entries = []
         # Same day rule is first
-        if has_key(acquisition_list, date_index, symbol):
-            same_day_quantity, same_day_amount, _same_day_fees = astuple(
-                acquisition_list[date_index][symbol]
-            )
+        same_day_acquisition = acquisition_list.get(date_index, {}).get(symbol)
+        if same_day_acquisition is not None:
+            same_day_quantity = same_day_acquisition.quantity
+            same_day_amount = same_day_acquisition.amount
             available_quantity = min(disposal_quantity, same_day_quantity)
             if available_quantity > 0:
                 acquisition_price = same_day_amount / same_day_quantity
@@ -384,10 +394,10 @@ class CapitalGainsCalculator:
                     acquisition_price,
                 )
                 disposal_quantity -= available_quantity
-                proceeds_amount -= available_quantity * disposal_price
+                proceeds_amount -= same_day_proceeds
                 current_quantity -= available_quantity
                 # These shares shouldn't be added to Section 104 holding
-                current_amount -= available_quantity * acquisition_price
+                current_amount -= same_day_allowable_cost
                 if current_quantity == 0:
                     assert (
                         round_decimal(current_amount, 23) == 0
@@ -410,29 +420,25 @@ class CapitalGainsCalculator:
         if disposal_quantity > 0:
             for i in range(BED_AND_BREAKFAST_DAYS):
                 search_index = date_index + datetime.timedelta(days=i + 1)
-                if has_key(acquisition_list, search_index, symbol):
-                    (
-                        acquisition_quantity,
-                        acquisition_amount,
-                        _acquisition_fees,
-                    ) = astuple(acquisition_list[search_index][symbol])
-
-                    bed_and_breakfast_quantity = Decimal(0)
-                    if has_key(bed_and_breakfast_list, search_index, symbol):
-                        (
-                            bed_and_breakfast_quantity,
-                            _bb_amount,
-                            _bb_fees,
-                        ) = astuple(bed_and_breakfast_list[search_index][symbol])
+                acquisition = acquisition_list.get(search_index, {}).get(symbol)
+                if acquisition is not None:
+                    bed_and_breakfast = bed_and_breakfast_list.get(
+                        search_index, {}
+                    ).get(symbol)
+                    disposal = disposal_list.get(search_index, {}).get(symbol)
+                    acquisition_quantity = acquisition.quantity
+                    acquisition_amount = acquisition.amount
+
+                    bed_and_breakfast_quantity = (
+                        bed_and_breakfast.quantity
+                        if bed_and_breakfast is not None
+                        else Decimal(0)
+                    )
                     assert bed_and_breakfast_quantity <= acquisition_quantity
 
-                    same_day_quantity = Decimal(0)
-                    if has_key(disposal_list, search_index, symbol):
-                        (
-                            same_day_quantity,
-                            _same_day_amount,
-                            _same_day_fees,
-                        ) = astuple(disposal_list[search_index][symbol])
+                    same_day_quantity = (
+                        disposal.quantity if disposal is not None else Decimal(0)
+                    )
                     if same_day_quantity > acquisition_quantity:
                         # If the number of shares disposed of exceeds the number
                         # acquired on the same day the excess shares will be identified
@@ -477,7 +483,7 @@ class CapitalGainsCalculator:
                         acquisition_price,
                     )
                     disposal_quantity -= available_quantity
-                    proceeds_amount -= available_quantity * disposal_price
+                    proceeds_amount -= bed_and_breakfast_proceeds
                     current_price = current_amount / current_quantity
                     amount_delta = available_quantity * current_price
                     current_quantity -= available_quantity
@@ -512,12 +518,13 @@ class CapitalGainsCalculator:
                     )
         if disposal_quantity > 0:
             allowable_cost = current_amount * disposal_quantity / current_quantity
-            chargeable_gain += proceeds_amount - allowable_cost
+            section_104_gain = proceeds_amount - allowable_cost
+            chargeable_gain += section_104_gain
             LOGGER.debug(
                 "SECTION 104, quantity %d, gain %s, proceeds amount %s, "
                 "allowable cost %s",
                 disposal_quantity,
-                proceeds_amount - allowable_cost,
+                section_104_gain,
                 proceeds_amount,
                 allowable_cost,
             )
@@ -533,7 +540,7 @@ class CapitalGainsCalculator:
                     rule_type=RuleType.SECTION_104,
                     quantity=disposal_quantity,
                     amount=proceeds_amount,
-                    gain=proceeds_amount - allowable_cost,
+                    gain=section_104_gain,
                     allowable_cost=allowable_cost,
                     fees=fees,
                     new_quantity=current_quantity,
@@ -545,7 +552,8 @@ class CapitalGainsCalculator:
         assert (
             round_decimal(disposal_quantity, 23) == 0
         ), f"disposal quantity {disposal_quantity}"
-        portfolio[symbol] = (current_quantity, current_amount)
+        position.quantity = current_quantity
+        position.amount = current_amount
         chargeable_gain = round_decimal(chargeable_gain, 2)
         return chargeable_gain, calculation_entries
 
@@ -564,12 +572,15 @@ class CapitalGainsCalculator:
         capital_gain = Decimal(0)
         capital_loss = Decimal(0)
         bed_and_breakfast_list: HmrcTransactionLog = {}
-        portfolio: dict[str, tuple[Decimal, Decimal]] = {}
+        portfolio: dict[str, Position] = {}
         calculation_log: CalculationLog = {}
-        for date_index in (
-            begin_index + datetime.timedelta(days=x)
-            for x in range(0, (end_index - begin_index).days + 1)
-        ):
+        # Only days with acquisitions or disposals have anything to process
+        event_dates = sorted(
+            date_index
+            for date_index in acquisition_list.keys() | disposal_list.keys()
+            if begin_index <= date_index <= end_index
+        )
+        for date_index in event_dates:
             if date_index in acquisition_list:
                 for symbol in acquisition_list[date_index]:
                     calculation_entries = self.process_acquisition(
@@ -583,7 +594,7 @@ class CapitalGainsCalculator:
                         if date_index not in calculation_log:
                             calculation_log[date_index] = {}
                         calculation_log[date_index][
-                            f"buy${symbol}"
+                            ("buy", symbol)
                         ] = calculation_entries
             if date_index in disposal_list:
                 for symbol in disposal_list[date_index]:
@@ -617,26 +628,31 @@ class CapitalGainsCalculator:
                             transaction_quantity,
                             round_decimal(transaction_capital_gain, 2),
                         )
-                        calculated_quantity = Decimal(0)
-                        calculated_proceeds = Decimal(0)
-                        calculated_gain = Decimal(0)
-                        for entry in calculation_entries:
-                            calculated_quantity += entry.quantity
-                            calculated_proceeds += entry.amount
-                            calculated_gain += entry.gain
-                        assert transaction_quantity == calculated_quantity
-                        assert round_decimal(
-                            transaction_disposal_proceeds, 10
-                        ) == round_decimal(
-                            calculated_proceeds, 10
-                        ), f"{transaction_disposal_proceeds} != {calculated_proceeds}"
-                        assert transaction_capital_gain == round_decimal(
-                            calculated_gain, 2
-                        )
+                        if __debug__:
+                            # Sanity check, stripped when running with -O
+                            calculated_quantity = sum(
+                                (entry.quantity for entry in calculation_entries),
+                                Decimal(0),
+                            )
+                            calculated_proceeds = sum(
+                                (entry.amount for entry in calculation_entries),
+                                Decimal(0),
+                            )
+                            calculated_gain = sum(
+                                (entry.gain for entry in calculation_entries),
+                                Decimal(0),
+                            )
+                            assert transaction_quantity == calculated_quantity
+                            expected = round_decimal(transaction_disposal_proceeds, 10)
+                            actual = round_decimal(calculated_proceeds, 10)
+                            assert expected == actual, f"{expected} != {actual}"
+                            assert transaction_capital_gain == round_decimal(
+                                calculated_gain, 2
+                            )
                         if date_index not in calculation_log:
                             calculation_log[date_index] = {}
                         calculation_log[date_index][
-                            f"sell${symbol}"
+                            ("sell", symbol)
                         ] = calculation_entries
                         if transaction_capital_gain > 0:
                             capital_gain += transaction_capital_gain
@@ -646,7 +662,12 @@ class CapitalGainsCalculator:
         allowance = CAPITAL_GAIN_ALLOWANCES.get(self.tax_year)
         return CapitalGainsReport(
             self.tax_year,
-            portfolio,
+            # Fully disposed symbols are dropped from the reported portfolio
+            {
+                symbol: position
+                for symbol, position in portfolio.items()
+                if position.quantity > 0
+            },
             disposal_count,
             round_decimal(disposal_proceeds, 2),
             round_decimal(allowable_costs, 2),
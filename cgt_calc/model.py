@@ -6,7 +6,7 @@ from dataclasses import dataclass
 import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .util import round_decimal
 
@@ -15,6 +15,8 @@ from .util import round_decimal
 class HmrcTransactionData:
     """Hmrc transaction figures."""
 
+    __slots__ = ("quantity", "amount", "fees")
+
     quantity: Decimal
     amount: Decimal
     fees: Decimal
@@ -24,6 +26,16 @@ class HmrcTransactionData:
 HmrcTransactionLog = Dict[datetime.date, Dict[str, HmrcTransactionData]]
 
 
+@dataclass
+class Position:
+    """Section 104 holding of a single symbol, updated in place."""
+
+    __slots__ = ("quantity", "amount")
+
+    quantity: Decimal
+    amount: Decimal
+
+
 class ActionType(Enum):
     """Type of transaction action."""
 
@@ -48,6 +60,19 @@ class ActionType(Enum):
 class BrokerTransaction:
     """Broken transaction data."""
 
+    __slots__ = (
+        "date",
+        "action",
+        "symbol",
+        "description",
+        "quantity",
+        "price",
+        "fees",
+        "amount",
+        "currency",
+        "broker",
+    )
+
     date: datetime.date
     action: ActionType
     symbol: str | None
@@ -71,6 +96,18 @@ class RuleType(Enum):
 class CalculationEntry:  # noqa: SIM119 # this has non-trivial constructor
     """Calculation entry for final report."""
 
+    __slots__ = (
+        "rule_type",
+        "quantity",
+        "amount",
+        "allowable_cost",
+        "fees",
+        "gain",
+        "new_quantity",
+        "new_pool_cost",
+        "bed_and_breakfast_date_index",
+    )
+
     def __init__(
         self,
         rule_type: RuleType,
@@ -114,7 +151,8 @@ class CalculationEntry:  # noqa: SIM119 # this has non-trivial constructor
         )
 
 
-CalculationLog = Dict[datetime.date, Dict[str, List[CalculationEntry]]]
+# Entries are keyed by ("buy" | "sell", symbol) for every date
+CalculationLog = Dict[datetime.date, Dict[Tuple[str, str], List[CalculationEntry]]]
 
 
 @dataclass
@@ -122,7 +160,7 @@ class CapitalGainsReport:
     """Store calculated report."""
 
     tax_year: int
-    portfolio: dict[str, tuple[Decimal, Decimal]]
+    portfolio: dict[str, Position]
     disposal_count: int
     disposal_proceeds: Decimal
     allowable_costs: Decimal
@@ -147,12 +185,11 @@ class CapitalGainsReport:
     def __str__(self) -> str:
         """Return string representation."""
         out = f"Portfolio at the end of {self.tax_year}/{self.tax_year + 1} tax year:\n"
-        for symbol, (quantity, amount) in self.portfolio.items():
-            if quantity > 0:
-                out += (
-                    f"  {symbol}: {round_decimal(quantity, 2)}, "
-                    f"£{round_decimal(amount, 2)}\n"
-                )
+        for symbol, position in self.portfolio.items():
+            out += (
+                f"  {symbol}: {round_decimal(position.quantity, 2)}, "
+                f"£{round_decimal(position.amount, 2)}\n"
+            )
         out += f"For tax year {self.tax_year}/{self.tax_year + 1}:\n"
         out += f"Number of disposals: {self.disposal_count}\n"
         out += f"Disposal proceeds: £{self.disposal_proceeds}\n"
@@ -6,6 +6,7 @@ import csv
 import datetime
 from decimal import Decimal
 import importlib.resources
+import operator
 from pathlib import Path
 
 from cgt_calc.const import DEFAULT_INITIAL_PRICES_FILE
@@ -88,7 +89,7 @@ def read_broker_transactions(
     else:
         print("INFO: No raw file provided")
 
-    transactions.sort(key=lambda k: k.date)
+    transactions.sort(key=operator.attrgetter("date"))
     return transactions
 
 
@@ -101,16 +102,16 @@ def read_initial_prices(
         csv_file = importlib.resources.open_text(
             RESOURCES_PACKAGE, DEFAULT_INITIAL_PRICES_FILE
         )
-        lines = list(csv.reader(csv_file))
-        csv_file.close()
     else:
-        with Path(initial_prices_file).open(encoding="utf-8") as csv_file:
-            lines = list(csv.reader(csv_file))
-    lines = lines[1:]
-    for row in lines:
-        entry = InitialPricesEntry(row, initial_prices_file or "default")
-        date_index = entry.date
-        if date_index not in initial_prices:
-            initial_prices[date_index] = {}
-        initial_prices[date_index][entry.symbol] = entry.price
+        csv_file = Path(initial_prices_file).open(encoding="utf-8")
+    with csv_file:
+        lines = csv.reader(csv_file)
+        # Skip header
+        next(lines, None)
+        for row in lines:
+            entry = InitialPricesEntry(row, initial_prices_file or "default")
+            date_index = entry.date
+            if date_index not in initial_prices:
+                initial_prices[date_index] = {}
+            initial_prices[date_index][entry.symbol] = entry.price
     return initial_prices
@@ -71,34 +71,45 @@ def _hacky_parse_decimal(decimal: str) -> Decimal:
 def _init_from_release_report(row_raw: list[str], filename: str) -> BrokerTransaction:
     if len(COLUMNS_RELEASE) != len(row_raw):
         raise UnexpectedColumnCountError(row_raw, len(COLUMNS_RELEASE), filename)
-    row = {col: row_raw[i] for i, col in enumerate(COLUMNS_RELEASE)}
-
-    if row["Type"] != "Release":
-        raise ParsingError(filename, f"Unknown type: {row_raw[3]}")
-
-    if row["Status"] != "Complete" and row["Status"] != "Staged":
-        raise ParsingError(filename, f"Unknown status: {row_raw[5]}")
-
-    if row["Price"][0] != "$":
-        raise ParsingError(filename, f"Unknown price currency: {row_raw[6]}")
-
-    if row["Net Cash Proceeds"] != "$0.00":
-        raise ParsingError(filename, f"Non-zero Net Cash Proceeds: {row_raw[8]}")
-
-    if row["Plan"] not in KNOWN_SYMBOL_DICT:
-        raise ParsingError(filename, f"Unknown plan: {row_raw[3]}")
-
-    quantity = _hacky_parse_decimal(row["Net Share Proceeds"])
-    price = _hacky_parse_decimal(row["Price"][1:])
+    (
+        vest_date,
+        _order_number,
+        plan,
+        type_,
+        status,
+        price_str,
+        _quantity,
+        net_cash_proceeds,
+        net_share_proceeds,
+        _tax_payment_method,
+    ) = row_raw
+
+    if type_ != "Release":
+        raise ParsingError(filename, f"Unknown type: {type_}")
+
+    if status not in ("Complete", "Staged"):
+        raise ParsingError(filename, f"Unknown status: {status}")
+
+    if price_str[0] != "$":
+        raise ParsingError(filename, f"Unknown price currency: {price_str}")
+
+    if net_cash_proceeds != "$0.00":
+        raise ParsingError(filename, f"Non-zero Net Cash Proceeds: {net_cash_proceeds}")
+
+    if plan not in KNOWN_SYMBOL_DICT:
+        raise ParsingError(filename, f"Unknown plan: {plan}")
+
+    quantity = _hacky_parse_decimal(net_share_proceeds)
+    price = _hacky_parse_decimal(price_str[1:])
     amount = quantity * price
-    symbol = KNOWN_SYMBOL_DICT[row["Plan"]]
+    symbol = KNOWN_SYMBOL_DICT[plan]
     symbol = TICKER_RENAMES.get(symbol, symbol)
 
     return BrokerTransaction(
-        date=datetime.datetime.strptime(row["Vest Date"], "%d-%b-%Y").date(),
+        date=datetime.datetime.strptime(vest_date, "%d-%b-%Y").date(),
         action=ActionType.STOCK_ACTIVITY,
         symbol=symbol,
-        description=row["Plan"],
+        description=plan,
         quantity=quantity,
         price=price,
         fees=Decimal(0),
@@ -142,36 +153,47 @@ def _init_from_withdrawal_report(
 
     if len(COLUMNS_WITHDRAWAL) != len(row_raw):
         raise UnexpectedColumnCountError(row_raw, len(COLUMNS_WITHDRAWAL), filename)
-    row = {col: row_raw[i] for i, col in enumerate(COLUMNS_WITHDRAWAL)}
-
-    if row["Type"] != "Sale":
-        raise ParsingError(filename, f"Unknown type: {row_raw[3]}")
-
-    if row["Order Status"] != "Complete":
-        raise ParsingError(filename, f"Unknown status: {row_raw[5]}")
-
-    if row["Price"][0] != "$":
-        raise ParsingError(filename, f"Unknown price currency: {row_raw[6]}")
-
-    if row["Plan"] not in KNOWN_SYMBOL_DICT:
-        raise ParsingError(filename, f"Unknown plan: {row_raw[3]}")
-
-    quantity = -_hacky_parse_decimal(row["Quantity"])
-    price = _hacky_parse_decimal(row["Price"][1:])
-    amount = _hacky_parse_decimal(row["Net Amount"][1:])
+    (
+        date_str,
+        _order_number,
+        plan,
+        type_,
+        order_status,
+        price_str,
+        quantity_str,
+        net_amount,
+        _net_share_proceeds,
+        _tax_payment_method,
+    ) = row_raw
+
+    if type_ != "Sale":
+        raise ParsingError(filename, f"Unknown type: {type_}")
+
+    if order_status != "Complete":
+        raise ParsingError(filename, f"Unknown status: {order_status}")
+
+    if price_str[0] != "$":
+        raise ParsingError(filename, f"Unknown price currency: {price_str}")
+
+    if plan not in KNOWN_SYMBOL_DICT:
+        raise ParsingError(filename, f"Unknown plan: {plan}")
+
+    quantity = -_hacky_parse_decimal(quantity_str)
+    price = _hacky_parse_decimal(price_str[1:])
+    amount = _hacky_parse_decimal(net_amount[1:])
     fees = quantity * price - amount
 
-    if row["Plan"] == "Cash":
+    if plan == "Cash":
         action = ActionType.TRANSFER
         amount *= -1
     else:
         action = ActionType.SELL
 
     transaction = BrokerTransaction(
-        date=datetime.datetime.strptime(row["Date"], "%d-%b-%Y").date(),
+        date=datetime.datetime.strptime(date_str, "%d-%b-%Y").date(),
         action=action,
-        symbol=KNOWN_SYMBOL_DICT[row["Plan"]],
-        description=row["Plan"],
+        symbol=KNOWN_SYMBOL_DICT[plan],
+        description=plan,
         quantity=quantity,
         price=price,
         fees=fees,
@@ -204,9 +226,8 @@ def read_mssb_transactions(transactions_folder: str) -> list[BrokerTransaction]:
             if Path(file).name not in ["Withdrawals Report.csv", "Releases Report.csv"]:
                 continue
 
-            lines = list(csv.reader(csv_file))
-            header = lines[0]
-            lines = lines[1:]
+            lines = csv.reader(csv_file)
+            header = next(lines)
 
             if Path(file).name == "Withdrawals Report.csv":
                 _validate_header(header, COLUMNS_WITHDRAWAL, str(file))
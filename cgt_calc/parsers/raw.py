@@ -34,6 +34,8 @@ class RawTransaction(BrokerTransaction):
     See tests/test_data/raw/test_data.csv for a sample file showing the expected format.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         row: list[str],
@@ -44,7 +46,7 @@ class RawTransaction(BrokerTransaction):
             raise UnexpectedColumnCountError(row, 7, file)
 
         date_str = row[0]
-        date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+        date = datetime.date.fromisoformat(date_str)
 
         action = action_from_str(row[1])
         symbol = row[2] if row[2] != "" else None
@@ -83,10 +85,10 @@ class RawTransaction(BrokerTransaction):
 def read_raw_transactions(transactions_file: str) -> list[BrokerTransaction]:
     """Read Raw transactions from file."""
     try:
-        with Path(transactions_file).open(encoding="utf-8") as csv_file:
-            lines = list(csv.reader(csv_file))
+        csv_file = Path(transactions_file).open(encoding="utf-8")
     except FileNotFoundError:
         print(f"WARNING: Couldn't locate Raw transactions file({transactions_file})")
         return []
 
-    return [RawTransaction(row, transactions_file) for row in lines]
+    with csv_file:
+        return [RawTransaction(row, transactions_file) for row in csv.reader(csv_file)]
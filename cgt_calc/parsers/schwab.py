@@ -9,8 +9,10 @@ import datetime
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
+from typing import Final
 
 from cgt_calc.const import TICKER_RENAMES
+from cgt_calc.dates import parse_slash_date
 from cgt_calc.exceptions import (
     ParsingError,
     SymbolMissingError,
@@ -56,83 +58,60 @@ class AwardPrices:
         for i in range(7):
             to_search = date - datetime.timedelta(days=i)
 
-            if (
-                to_search in self.award_prices
-                and symbol in self.award_prices[to_search]
-            ):
-                return (to_search, self.award_prices[to_search][symbol])
+            price = self.award_prices.get(to_search, {}).get(symbol)
+            if price is not None:
+                return (to_search, price)
         raise KeyError(f"Award price is not found for symbol {symbol} for date {date}")
 
 
-def action_from_str(label: str) -> ActionType:
-    """Convert string label to ActionType."""
-    if label == "Buy":
-        return ActionType.BUY
-
-    if label == "Sell":
-        return ActionType.SELL
-
-    if label in [
-        "MoneyLink Transfer",
-        "Misc Cash Entry",
-        "Service Fee",
-        "Wire Funds",
-        "Wire Sent",
-        "Funds Received",
-        "Journal",
-        "Cash In Lieu",
-        "Visa Purchase",
-        "MoneyLink Deposit",
-    ]:
-        return ActionType.TRANSFER
-
-    if label == "Stock Plan Activity":
-        return ActionType.STOCK_ACTIVITY
-
-    if label in [
-        "Qualified Dividend",
-        "Cash Dividend",
-        "Qual Div Reinvest",
-        "Div Adjustment",
-    ]:
-        return ActionType.DIVIDEND
-
-    if label in ["NRA Tax Adj", "NRA Withholding", "Foreign Tax Paid"]:
-        return ActionType.TAX
-
-    if label == "ADR Mgmt Fee":
-        return ActionType.FEE
-
-    if label in ["Adjustment", "IRS Withhold Adj"]:
-        return ActionType.ADJUSTMENT
-
-    if label in ["Short Term Cap Gain", "Long Term Cap Gain"]:
-        return ActionType.CAPITAL_GAIN
+_ACTION_LABELS: Final[dict[str, ActionType]] = {
+    "Buy": ActionType.BUY,
+    "Sell": ActionType.SELL,
+    "MoneyLink Transfer": ActionType.TRANSFER,
+    "Misc Cash Entry": ActionType.TRANSFER,
+    "Service Fee": ActionType.TRANSFER,
+    "Wire Funds": ActionType.TRANSFER,
+    "Wire Sent": ActionType.TRANSFER,
+    "Funds Received": ActionType.TRANSFER,
+    "Journal": ActionType.TRANSFER,
+    "Cash In Lieu": ActionType.TRANSFER,
+    "Visa Purchase": ActionType.TRANSFER,
+    "MoneyLink Deposit": ActionType.TRANSFER,
+    "Stock Plan Activity": ActionType.STOCK_ACTIVITY,
+    "Qualified Dividend": ActionType.DIVIDEND,
+    "Cash Dividend": ActionType.DIVIDEND,
+    "Qual Div Reinvest": ActionType.DIVIDEND,
+    "Div Adjustment": ActionType.DIVIDEND,
+    "NRA Tax Adj": ActionType.TAX,
+    "NRA Withholding": ActionType.TAX,
+    "Foreign Tax Paid": ActionType.TAX,
+    "ADR Mgmt Fee": ActionType.FEE,
+    "Adjustment": ActionType.ADJUSTMENT,
+    "IRS Withhold Adj": ActionType.ADJUSTMENT,
+    "Short Term Cap Gain": ActionType.CAPITAL_GAIN,
+    "Long Term Cap Gain": ActionType.CAPITAL_GAIN,
+    "Spin-off": ActionType.SPIN_OFF,
+    "Credit Interest": ActionType.INTEREST,
+    "Reinvest Shares": ActionType.REINVEST_SHARES,
+    "Reinvest Dividend": ActionType.REINVEST_DIVIDENDS,
+    "Wire Funds Received": ActionType.WIRE_FUNDS_RECEIVED,
+    "Stock Split": ActionType.STOCK_SPLIT,
+}
 
-    if label == "Spin-off":
-        return ActionType.SPIN_OFF
 
-    if label == "Credit Interest":
-        return ActionType.INTEREST
-
-    if label == "Reinvest Shares":
-        return ActionType.REINVEST_SHARES
-
-    if label == "Reinvest Dividend":
-        return ActionType.REINVEST_DIVIDENDS
-
-    if label == "Wire Funds Received":
-        return ActionType.WIRE_FUNDS_RECEIVED
-
-    if label == "Stock Split":
-        return ActionType.STOCK_SPLIT
-
-    raise ParsingError("schwab transactions", f"Unknown action: {label}")
+def action_from_str(label: str) -> ActionType:
+    """Convert string label to ActionType."""
+    try:
+        return _ACTION_LABELS[label]
+    except KeyError:
+        raise ParsingError("schwab transactions", f"Unknown action: {label}") from None
 
 
 class SchwabTransaction(BrokerTransaction):
     """Represent single Schwab transaction."""
 
+    __slots__ = ("raw_action",)
+
     def __init__(
         self,
         row_dict: OrderedDict[str, str],
@@ -151,7 +130,7 @@ class SchwabTransaction(BrokerTransaction):
             date_str = row_dict[date_header][index:]
         else:
             date_str = row_dict[date_header]
-        date = datetime.datetime.strptime(date_str, "%m/%d/%Y").date()
+        date = parse_slash_date(date_str)
         action_header = SchwabTransactionsFileRequiredHeaders.ACTION.value
         self.raw_action = row_dict[action_header]
         action = action_from_str(self.raw_action)
@@ -231,8 +210,8 @@ def read_schwab_transactions(
     awards_prices = _read_schwab_awards(schwab_award_transactions_file)
     try:
         with Path(transactions_file).open(encoding="utf-8") as csv_file:
-            lines = list(csv.reader(csv_file))
-            headers = lines[0]
+            lines = csv.reader(csv_file)
+            headers = next(lines)
 
             required_headers = set(
                 {header.value for header in SchwabTransactionsFileRequiredHeaders}
@@ -244,16 +223,14 @@ def read_schwab_transactions(
                     f"{required_headers.difference(headers)}",
                 )
 
-            # Remove header
-            lines = lines[1:]
-            transactions = [
+            transactions: list[BrokerTransaction] = [
                 SchwabTransaction.create(
                     OrderedDict(zip(headers, row)), transactions_file, awards_prices
                 )
                 for row in lines
             ]
             transactions.reverse()
-            return list(transactions)
+            return transactions
     except FileNotFoundError:
         print(f"WARNING: Couldn't locate Schwab transactions file({transactions_file})")
         return []
@@ -320,7 +297,7 @@ def _read_schwab_awards(
         try:
             date = datetime.datetime.strptime(date_str, "%Y/%m/%d").date()
         except ValueError:
-            date = datetime.datetime.strptime(date_str, "%m/%d/%Y").date()
+            date = parse_slash_date(date_str)
         symbol_header = AwardsTransactionsFileRequiredHeaders.SYMBOL.value
         symbol = row_dict[symbol_header] if row_dict[symbol_header] != "" else None
         fair_market_value_price_header = (
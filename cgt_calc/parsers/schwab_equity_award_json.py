@@ -19,12 +19,13 @@ import datetime
 from decimal import Decimal
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from pandas.tseries.holiday import USFederalHolidayCalendar
 from pandas.tseries.offsets import CustomBusinessDay
 
 from cgt_calc.const import TICKER_RENAMES
+from cgt_calc.dates import parse_slash_date
 from cgt_calc.exceptions import ParsingError
 from cgt_calc.model import ActionType, BrokerTransaction
 from cgt_calc.util import round_decimal
@@ -95,60 +96,44 @@ ROUND_DIGITS = 6
 JsonRowType = Any  # type: ignore[misc]
 
 
-def action_from_str(label: str) -> ActionType:
-    """Convert string label to ActionType."""
-    if label in {"Buy"}:
-        return ActionType.BUY
-
-    if label in {"Sell", "Sale"}:
-        return ActionType.SELL
-
-    if label in {
-        "MoneyLink Transfer",
-        "Misc Cash Entry",
-        "Service Fee",
-        "Wire Funds",
-        "Wire Transfer",
-        "Funds Received",
-        "Journal",
-        "Cash In Lieu",
-    }:
-        return ActionType.TRANSFER
-
-    if label in {"Stock Plan Activity", "Deposit"}:
-        return ActionType.STOCK_ACTIVITY
-
-    if label in ["Qualified Dividend", "Cash Dividend"]:
-        return ActionType.DIVIDEND
-
-    if label in ["NRA Tax Adj", "NRA Withholding", "Foreign Tax Paid"]:
-        return ActionType.TAX
-
-    if label == "ADR Mgmt Fee":
-        return ActionType.FEE
-
-    if label in ["Adjustment", "IRS Withhold Adj"]:
-        return ActionType.ADJUSTMENT
-
-    if label in ["Short Term Cap Gain", "Long Term Cap Gain"]:
-        return ActionType.CAPITAL_GAIN
-
-    if label == "Spin-off":
-        return ActionType.SPIN_OFF
+_ACTION_LABELS: Final[dict[str, ActionType]] = {
+    "Buy": ActionType.BUY,
+    "Sell": ActionType.SELL,
+    "Sale": ActionType.SELL,
+    "MoneyLink Transfer": ActionType.TRANSFER,
+    "Misc Cash Entry": ActionType.TRANSFER,
+    "Service Fee": ActionType.TRANSFER,
+    "Wire Funds": ActionType.TRANSFER,
+    "Wire Transfer": ActionType.TRANSFER,
+    "Funds Received": ActionType.TRANSFER,
+    "Journal": ActionType.TRANSFER,
+    "Cash In Lieu": ActionType.TRANSFER,
+    "Stock Plan Activity": ActionType.STOCK_ACTIVITY,
+    "Deposit": ActionType.STOCK_ACTIVITY,
+    "Qualified Dividend": ActionType.DIVIDEND,
+    "Cash Dividend": ActionType.DIVIDEND,
+    "NRA Tax Adj": ActionType.TAX,
+    "NRA Withholding": ActionType.TAX,
+    "Foreign Tax Paid": ActionType.TAX,
+    "ADR Mgmt Fee": ActionType.FEE,
+    "Adjustment": ActionType.ADJUSTMENT,
+    "IRS Withhold Adj": ActionType.ADJUSTMENT,
+    "Short Term Cap Gain": ActionType.CAPITAL_GAIN,
+    "Long Term Cap Gain": ActionType.CAPITAL_GAIN,
+    "Spin-off": ActionType.SPIN_OFF,
+    "Credit Interest": ActionType.INTEREST,
+    "Reinvest Shares": ActionType.REINVEST_SHARES,
+    "Reinvest Dividend": ActionType.REINVEST_DIVIDENDS,
+    "Wire Funds Received": ActionType.WIRE_FUNDS_RECEIVED,
+}
 
-    if label == "Credit Interest":
-        return ActionType.INTEREST
 
-    if label == "Reinvest Shares":
-        return ActionType.REINVEST_SHARES
-
-    if label == "Reinvest Dividend":
-        return ActionType.REINVEST_DIVIDENDS
-
-    if label == "Wire Funds Received":
-        return ActionType.WIRE_FUNDS_RECEIVED
-
-    raise ParsingError("schwab transactions", f"Unknown action: {label}")
+def action_from_str(label: str) -> ActionType:
+    """Convert string label to ActionType."""
+    try:
+        return _ACTION_LABELS[label]
+    except KeyError:
+        raise ParsingError("schwab transactions", f"Unknown action: {label}") from None
 
 
 def _decimal_from_str(price_str: str) -> Decimal:
@@ -174,12 +159,14 @@ def _decimal_from_number_or_str(
     if the fields are not there or both have a value of None.
     """
     # We prefer native number to strings as more efficient/safer parsing
-    float_name = f"{field_basename}{field_float_suffix}"
-    if float_name in row and row[float_name] is not None:
-        return Decimal(row[float_name])
+    number = row.get(f"{field_basename}{field_float_suffix}")
+    if number is not None:
+        # Numbers are already parsed as Decimal by json.load
+        return number if isinstance(number, Decimal) else Decimal(number)
 
-    if field_basename in row and row[field_basename] is not None:
-        return _decimal_from_str(row[field_basename])
+    number_str = row.get(field_basename)
+    if number_str is not None:
+        return _decimal_from_str(number_str)
 
     return Decimal(0)
 
@@ -191,31 +178,31 @@ def _is_integer(number: Decimal) -> bool:
 class SchwabTransaction(BrokerTransaction):
     """Represent single Schwab transaction."""
 
+    __slots__ = ("raw_action",)
+
     def __init__(self, row: JsonRowType, file: str, field_names: FieldNames) -> None:
         """Create a new SchwabTransaction from a JSON row."""
         names = field_names
         description = row[names.description]
-        self.raw_action = row[names.action]
-        action = action_from_str(self.raw_action)
+        raw_action = row[names.action]
+        self.raw_action = raw_action
+        action = action_from_str(raw_action)
         symbol = row.get(names.symbol)
         symbol = TICKER_RENAMES.get(symbol, symbol)
         quantity = _decimal_from_number_or_str(row, names.quantity)
         amount = _decimal_from_number_or_str(row, names.amount)
         fees = _decimal_from_number_or_str(row, names.fees)
-        if row[names.action] == "Deposit":
-            if len(row[names.transac_details]) != 1:
+        if raw_action == "Deposit":
+            transac_details = row[names.transac_details]
+            if len(transac_details) != 1:
                 raise ParsingError(
                     file,
                     "Expected a single Transaction Details for a Deposit, but "
-                    f"found {len(row[names.transac_details])}",
+                    f"found {len(transac_details)}",
                 )
-            if OPTIONAL_DETAILS_NAME in row[names.transac_details][0]:
-                details = row[names.transac_details][0]["Details"]
-            else:
-                details = row[names.transac_details][0]
-            date = datetime.datetime.strptime(
-                details[names.vest_date], "%m/%d/%Y"
-            ).date()
+            details = transac_details[0]
+            details = details.get(OPTIONAL_DETAILS_NAME, details)
+            date = parse_slash_date(details[names.vest_date])
             # Schwab only provide this one as string:
             price = _decimal_from_str(details[names.vest_fair_market_value])
             if amount == Decimal(0):
@@ -225,12 +212,11 @@ class SchwabTransaction(BrokerTransaction):
                 f"{details[names.award_date]} "
                 f"(ID {details[names.award_id]})"
             )
-        elif row[names.action] == "Sale":
+        elif raw_action == "Sale":
             # Schwab's data export shows the settlement date,
             # whereas HMRC wants the trade date:
             date = (
-                datetime.datetime.strptime(row[names.date], "%m/%d/%Y").date()
-                - SETTLEMENT_DELAY
+                parse_slash_date(row[names.date]) - SETTLEMENT_DELAY
             ).date()  # type: ignore[attr-defined]
 
             # Schwab's data export sometimes lacks decimals on Sales
@@ -243,16 +229,17 @@ class SchwabTransaction(BrokerTransaction):
                 subtransac_shares_sum = Decimal()  # Decimal 0
                 found_share_decimals = False
 
-                details = row[names.transac_details][0].get(
-                    OPTIONAL_DETAILS_NAME, row[names.transac_details][0]
-                )
-
-                for subtransac in row[names.transac_details]:
-                    subtransac = subtransac.get(OPTIONAL_DETAILS_NAME, subtransac)
+                shares_name = names.shares
+                sale_price_name = names.sale_price
+                subtransacs = [
+                    subtransac.get(OPTIONAL_DETAILS_NAME, subtransac)
+                    for subtransac in row[names.transac_details]
+                ]
 
+                for subtransac in subtransacs:
                     if "shares" in subtransac:
                         # Schwab only provides this one as a string:
-                        shares = _decimal_from_str(subtransac[names.shares])
+                        shares = _decimal_from_str(subtransac[shares_name])
                         subtransac_shares_sum += shares
                         if not _is_integer(shares):
                             found_share_decimals = True
@@ -269,17 +256,11 @@ class SchwabTransaction(BrokerTransaction):
                     # We can only work-out the correct quantity if all
                     # sub-transactions have the same price:
 
-                    first_subtransac = row[names.transac_details][0]
-                    first_subtransac = first_subtransac.get(
-                        OPTIONAL_DETAILS_NAME, first_subtransac
-                    )
-                    price_str = first_subtransac[names.sale_price]
+                    price_str = subtransacs[0][sale_price_name]
                     price = _decimal_from_str(price_str)
 
-                    for subtransac in row[names.transac_details][1:]:
-                        subtransac = subtransac.get(OPTIONAL_DETAILS_NAME, subtransac)
-
-                        if subtransac[names.sale_price] != price_str:
+                    for subtransac in subtransacs[1:]:
+                        if subtransac[sale_price_name] != price_str:
                             raise ParsingError(
                                 file,
                                 "Impossible to work out quantity of sale of "
@@ -292,7 +273,7 @@ class SchwabTransaction(BrokerTransaction):
 
         else:
             raise ParsingError(
-                file, f"Parsing for action {row[names.action]} is not implemented!"
+                file, f"Parsing for action {raw_action} is not implemented!"
             )
 
         currency = "USD"
@@ -367,14 +348,14 @@ def read_schwab_equity_award_json_transactions(
                     "in the expected format",
                 )
 
-            transactions = [
+            transactions: list[BrokerTransaction] = [
                 SchwabTransaction(transac, transactions_file, fields)
                 for transac in data[fields.transactions]
                 # Skip as not relevant for CGT
                 if transac[fields.action] not in {"Journal", "Wire Transfer"}
             ]
             transactions.reverse()
-            return list(transactions)
+            return transactions
     except FileNotFoundError:
         print(f"WARNING: Couldn't locate Schwab transactions file({transactions_file})")
         return []
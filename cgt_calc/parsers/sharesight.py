@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 import csv
-from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+import operator
 from pathlib import Path
 from typing import Final, Iterable, Iterator, List
 
 from cgt_calc.const import TICKER_RENAMES
+from cgt_calc.dates import parse_slash_date
 from cgt_calc.exceptions import InvalidTransactionError, ParsingError
 from cgt_calc.model import ActionType, BrokerTransaction
 
 STOCK_ACTIVITY_COMMENT_MARKER: Final[str] = "Stock Activity"
 
-
-def parse_date(val: str) -> date:
-    """Parse a Sharesight report date."""
-
-    return datetime.strptime(val, "%d/%m/%Y").date()
+# Columns of the All Trades Report read by parse_trades, in unpacking order
+TRADE_COLUMNS: Final[tuple[str, ...]] = (
+    "Type",
+    "Market",
+    "Code",
+    "Date",
+    "Quantity",
+    "Price *",
+    "Brokerage *",
+    "Currency",
+    "Comments",
+    "Value",
+)
 
 
 def parse_decimal(val: str) -> Decimal:
@@ -40,6 +49,8 @@ class SharesightTransaction(BrokerTransaction):
     Just a marker type for now
     """
 
+    __slots__ = ()
+
 
 class RowIterator(Iterator[List[str]]):
     """Iterator for CSV rows that keeps track of line number."""
@@ -73,27 +84,28 @@ def parse_dividend_payments(
     if columns is None:
         return
 
+    index = {column: i for i, column in enumerate(columns)}
+    currency_index = index.get("Currency")
+
     for row in rows:
         if row[0] == "Total":
             # Don't use the totals row, but it signals the end of the section
             break
 
-        row_dict = dict(zip(columns, row))
-
-        dividend_date = parse_date(row_dict["Date Paid"])
-        symbol = row_dict["Code"]
+        dividend_date = parse_slash_date(row[index["Date Paid"]], day_first=True)
+        symbol = row[index["Code"]]
         symbol = TICKER_RENAMES.get(symbol, symbol)
-        description = row_dict["Comments"]
+        description = row[index["Comments"]]
         broker = "Sharesight"
 
-        currency = row_dict.get("Currency")
+        currency = row[currency_index] if currency_index is not None else None
         # If we have a currency this is foreign income, otherwise it's local
         if currency:
-            amount = parse_decimal(row_dict["Gross Amount"])
-            tax = maybe_decimal(row_dict["Foreign Tax Deducted"])
+            amount = parse_decimal(row[index["Gross Amount"]])
+            tax = maybe_decimal(row[index["Foreign Tax Deducted"]])
         else:
-            amount = parse_decimal(row_dict["Gross Dividend"])
-            tax = maybe_decimal(row_dict["Tax Deducted"])
+            amount = parse_decimal(row[index["Gross Dividend"]])
+            tax = maybe_decimal(row[index["Tax Deducted"]])
             # Local income must be in GBP, otherwise why are you using this tool?
             currency = "GBP"
 
@@ -150,19 +162,17 @@ def parse_foreign_income(rows: Iterator[list[str]]) -> Iterable[SharesightTransa
 def parse_income_report(file: Path) -> Iterable[SharesightTransaction]:
     """Parse the Taxable Income Report from Sharesight."""
 
-    with file.open(encoding="utf-8") as csv_file:
-        rows = list(csv.reader(csv_file))
-
-    # Use our custom iterator for error reporting
-    rows_iter = RowIterator(rows)
-    for row in rows_iter:
-        try:
-            if row[0] == "Local Income":
-                yield from parse_local_income(rows_iter)
-            elif row[0] == "Foreign Income":
-                yield from parse_foreign_income(rows_iter)
-        except ValueError as err:
-            raise ParsingError(f"{file}:{rows_iter.line}", str(err)) from None
+    with file.open(encoding="utf-8", newline="") as csv_file:
+        # Use our custom iterator for error reporting
+        rows_iter = RowIterator(csv.reader(csv_file))
+        for row in rows_iter:
+            try:
+                if row[0] == "Local Income":
+                    yield from parse_local_income(rows_iter)
+                elif row[0] == "Foreign Income":
+                    yield from parse_foreign_income(rows_iter)
+            except ValueError as err:
+                raise ParsingError(f"{file}:{rows_iter.line}", str(err)) from None
 
 
 def parse_trades(
@@ -170,13 +180,27 @@ def parse_trades(
 ) -> Iterable[SharesightTransaction]:
     """Parse content in All Trades Report from Sharesight."""
 
+    trade_fields = operator.itemgetter(
+        *(columns.index(column) for column in TRADE_COLUMNS)
+    )
+
     for row in rows:
         if not any(row):
             # There is an empty row at the end of the trades list
             break
 
-        row_dict = dict(zip(columns, row))
-        tpe = row_dict["Type"]
+        (
+            tpe,
+            market,
+            code,
+            date_str,
+            quantity_str,
+            price_str,
+            brokerage_str,
+            currency,
+            description,
+            value_str,
+        ) = trade_fields(row)
         if tpe == "Buy":
             action = ActionType.BUY
         elif tpe == "Sell":
@@ -184,16 +208,13 @@ def parse_trades(
         else:
             raise ValueError(f"Unknown action: {tpe}")
 
-        market = row_dict["Market"]
-        symbol = f"{market}:{row_dict['Code']}"
-        trade_date = parse_date(row_dict["Date"])
-        quantity = parse_decimal(row_dict["Quantity"])
-        price = parse_decimal(row_dict["Price *"])
-        fees = maybe_decimal(row_dict["Brokerage *"]) or Decimal(0)
-        currency = row_dict["Currency"]
-        description = row_dict["Comments"]
+        symbol = f"{market}:{code}"
+        trade_date = parse_slash_date(date_str, day_first=True)
+        quantity = parse_decimal(quantity_str)
+        price = parse_decimal(price_str)
+        fees = maybe_decimal(brokerage_str) or Decimal(0)
         broker = "Sharesight"
-        gbp_value = maybe_decimal(row_dict["Value"])
+        gbp_value = maybe_decimal(value_str)
 
         # Sharesight's reports conventions are slightly different from our
         # conventions:
@@ -249,19 +270,17 @@ def parse_trades(
 def parse_trade_report(file: Path) -> Iterable[SharesightTransaction]:
     """Parse All Trades Report from Sharesight."""
 
-    with file.open(encoding="utf-8") as csv_file:
-        rows = list(csv.reader(csv_file))
-
-    # Use our custom iterator for error reporting
-    rows_iter = RowIterator(rows)
-    for row in rows_iter:
-        # Skip everything until we find the header
-        if row[0] == "Market":
-            columns = row
-            try:
-                yield from parse_trades(columns, rows_iter)
-            except (InvalidOperation, ValueError) as err:
-                raise ParsingError(f"{file}:{rows_iter.line}", str(err)) from None
+    with file.open(encoding="utf-8", newline="") as csv_file:
+        # Use our custom iterator for error reporting
+        rows_iter = RowIterator(csv.reader(csv_file))
+        for row in rows_iter:
+            # Skip everything until we find the header
+            if row[0] == "Market":
+                columns = row
+                try:
+                    yield from parse_trades(columns, rows_iter)
+                except (InvalidOperation, ValueError) as err:
+                    raise ParsingError(f"{file}:{rows_iter.line}", str(err)) from None
 
 
 def read_sharesight_transactions(
@@ -285,8 +304,5 @@ def read_sharesight_transactions(
             else:
                 transactions += trade_transactions
 
-    def key(transaction: SharesightTransaction) -> date:
-        return transaction.date
-
-    transactions.sort(key=key)
+    transactions.sort(key=operator.attrgetter("date"))
     return transactions
@@ -45,48 +45,60 @@ def decimal_or_none(val: str) -> Decimal | None:
     return Decimal(val) if val not in ["", "Not available"] else None
 
 
-def action_from_str(label: str, filename: str) -> ActionType:
-    """Convert label to ActionType."""
-    if label in [
-        "Market buy",
-        "Limit buy",
-    ]:
-        return ActionType.BUY
-
-    if label in [
-        "Market sell",
-        "Limit sell",
-    ]:
-        return ActionType.SELL
-
-    if label in [
-        "Deposit",
-        "Withdrawal",
-    ]:
-        return ActionType.TRANSFER
-
-    if label in [
-        "Dividend (Ordinary)",
-        "Dividend (Dividend)",
-        "Dividend (Dividends paid by us corporations)",
-    ]:
-        return ActionType.DIVIDEND
+_ACTION_LABELS: Final[dict[str, ActionType]] = {
+    "Market buy": ActionType.BUY,
+    "Limit buy": ActionType.BUY,
+    "Market sell": ActionType.SELL,
+    "Limit sell": ActionType.SELL,
+    "Deposit": ActionType.TRANSFER,
+    "Withdrawal": ActionType.TRANSFER,
+    "Dividend (Ordinary)": ActionType.DIVIDEND,
+    "Dividend (Dividend)": ActionType.DIVIDEND,
+    "Dividend (Dividends paid by us corporations)": ActionType.DIVIDEND,
+    "Interest on cash": ActionType.INTEREST,
+}
 
-    if label in ["Interest on cash"]:
-        return ActionType.INTEREST
 
-    raise ParsingError(filename, f"Unknown action: {label}")
+def action_from_str(label: str, filename: str) -> ActionType:
+    """Convert label to ActionType."""
+    try:
+        return _ACTION_LABELS[label]
+    except KeyError:
+        raise ParsingError(filename, f"Unknown action: {label}") from None
+
+
+def parse_time(time_str: str) -> datetime:
+    """Parse a Trading 212 timestamp, with optional fractional seconds."""
+    try:
+        # Fast path for the usual "YYYY-MM-DD HH:MM:SS[.ffffff]" layout
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        time_format = "%Y-%m-%d %H:%M:%S.%f" if "." in time_str else "%Y-%m-%d %H:%M:%S"
+        return datetime.strptime(time_str, time_format)
 
 
 class Trading212Transaction(BrokerTransaction):
     """Represent single Trading 212 transaction."""
 
+    __slots__ = (
+        "datetime",
+        "raw_action",
+        "price_foreign",
+        "currency_foreign",
+        "exchange_rate",
+        "transaction_fee",
+        "finra_fee",
+        "stamp_duty",
+        "conversion_fee",
+        "isin",
+        "transaction_id",
+        "notes",
+    )
+
     def __init__(self, header: list[str], row_raw: list[str], filename: str):
         """Create transaction from CSV row."""
         row = dict(zip(header, row_raw))
-        time_str = row["Time"]
-        time_format = "%Y-%m-%d %H:%M:%S.%f" if "." in time_str else "%Y-%m-%d %H:%M:%S"
-        self.datetime = datetime.strptime(time_str, time_format)
+        self.datetime = parse_time(row["Time"])
         date = self.datetime.date()
         self.raw_action = row["Action"]
         action = action_from_str(self.raw_action, filename)
@@ -175,10 +187,9 @@ def read_trading212_transactions(transactions_folder: str) -> list[BrokerTransac
     for file in Path(transactions_folder).glob("*.csv"):
         with Path(file).open(encoding="utf-8") as csv_file:
             print(f"Parsing {file}")
-            lines = list(csv.reader(csv_file))
-            header = lines[0]
+            lines = csv.reader(csv_file)
+            header = next(lines)
             validate_header(header, str(file))
-            lines = lines[1:]
             cur_transactions = [
                 Trading212Transaction(header, row, str(file)) for row in lines
             ]
@@ -1,6 +1,7 @@
 """Render PDF report with LaTeX."""
 
 from decimal import Decimal
+import functools
 import os
 from pathlib import Path
 import subprocess
@@ -13,13 +14,9 @@ from .model import CapitalGainsReport
 from .util import round_decimal, strip_zeros
 
 
-def render_calculations(
-    report: CapitalGainsReport,
-    output_path: Path,
-    skip_pdflatex: bool = False,
-) -> None:
-    """Render PDF report."""
-    print("Generate calculations report")
+@functools.lru_cache(maxsize=None)
+def _get_template() -> jinja2.Template:
+    """Load the calculations template once and reuse it across renders."""
     latex_template_env = jinja2.Environment(
         block_start_string="\\BLOCK{",
         block_end_string="}",
@@ -33,7 +30,17 @@ def render_calculations(
         autoescape=False,
         loader=jinja2.PackageLoader(PACKAGE_NAME, "resources"),
     )
-    template = latex_template_env.get_template(TEMPLATE_NAME)
+    return latex_template_env.get_template(TEMPLATE_NAME)
+
+
+def render_calculations(
+    report: CapitalGainsReport,
+    output_path: Path,
+    skip_pdflatex: bool = False,
+) -> None:
+    """Render PDF report."""
+    print("Generate calculations report")
+    template = _get_template()
     output_text = template.render(
         report=report,
         round_decimal=round_decimal,
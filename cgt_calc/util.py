@@ -6,9 +6,7 @@ from decimal import Decimal
 
 def round_decimal(value: Decimal, digits: int = 0) -> Decimal:
     """Round decimal to given precision."""
-    with decimal.localcontext() as ctx:
-        ctx.rounding = decimal.ROUND_HALF_UP
-        return Decimal(round(value, digits))
+    return value.quantize(Decimal((0, (1,), -digits)), rounding=decimal.ROUND_HALF_UP)
 
 
 def strip_zeros(value: Decimal) -> str:
@@ -0,0 +1,89 @@
+"""Test currency converter."""
+
+from __future__ import annotations
+
+import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from cgt_calc.currency_converter import CurrencyConverter
+from cgt_calc.exceptions import ParsingError
+
+
+def test_rates_are_monthly() -> None:
+    """Any day of the month uses the same monthly rate."""
+    converter = CurrencyConverter(
+        None, {datetime.date(2021, 6, 15): {"USD": Decimal("1.25")}}
+    )
+    for day in (1, 15, 30):
+        date = datetime.date(2021, 6, day)
+        assert converter.currency_to_gbp_rate("USD", date) == Decimal("1.25")
+        assert converter.to_gbp(Decimal(5), "USD", date) == Decimal(4)
+    assert converter.to_gbp(Decimal(5), "GBP", datetime.date(2021, 7, 1)) == Decimal(5)
+
+
+def test_read_exchange_rates_file(tmp_path: Path) -> None:
+    """Every row of the exchange rates file is loaded."""
+    exchange_rates_file = tmp_path / "exchange_rates.csv"
+    exchange_rates_file.write_text(
+        "month,currency,rate\n"
+        "2021-01-01,USD,1.3672\n"
+        "2021-01-01,EUR,1.1\n"
+        "2021-02-01,USD,1.3598\n"
+    )
+    converter = CurrencyConverter(str(exchange_rates_file))
+    assert converter.cache == {
+        datetime.date(2021, 1, 1): {"USD": Decimal("1.3672"), "EUR": Decimal("1.1")},
+        datetime.date(2021, 2, 1): {"USD": Decimal("1.3598")},
+    }
+
+
+def test_query_hmrc_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Monthly rates are parsed from the HMRC XML response."""
+    response = mock.Mock(
+        ok=True,
+        text=(
+            "<exchangeRateMonthList>"
+            "<exchangeRate><countryName>USA</countryName>"
+            "<currencyCode>usd</currencyCode><rateNew>1.3672</rateNew>"
+            "</exchangeRate>"
+            "<exchangeRate><countryName>Eurozone</countryName>"
+            "<currencyCode>EUR</currencyCode><rateNew>1.1</rateNew>"
+            "</exchangeRate>"
+            "</exchangeRateMonthList>"
+        ),
+    )
+    converter = CurrencyConverter()
+    monkeypatch.setattr(converter.session, "get", mock.Mock(return_value=response))
+    date = datetime.date(2021, 1, 15)
+    assert converter.currency_to_gbp_rate("USD", date) == Decimal("1.3672")
+    assert converter.cache == {
+        datetime.date(2021, 1, 1): {"USD": Decimal("1.3672"), "EUR": Decimal("1.1")}
+    }
+
+
+def test_query_hmrc_api_missing_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rows without a rate are reported as a parsing error."""
+    response = mock.Mock(
+        ok=True,
+        text=(
+            "<exchangeRateMonthList><exchangeRate>"
+            "<currencyCode>USD</currencyCode>"
+            "</exchangeRate></exchangeRateMonthList>"
+        ),
+    )
+    converter = CurrencyConverter()
+    monkeypatch.setattr(converter.session, "get", mock.Mock(return_value=response))
+    with pytest.raises(ParsingError):
+        converter.currency_to_gbp_rate("USD", datetime.date(2021, 1, 15))
+
+
+def test_read_exchange_rates_file_empty_rate(tmp_path: Path) -> None:
+    """An empty rate is reported as a parsing error."""
+    exchange_rates_file = tmp_path / "exchange_rates.csv"
+    exchange_rates_file.write_text("month,currency,rate\n2021-01-01,USD,\n")
+    with pytest.raises(ParsingError):
+        CurrencyConverter(str(exchange_rates_file))
@@ -103,7 +103,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=1, month=5, year=2020): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(3),
@@ -114,7 +114,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal(16),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(3),
@@ -172,7 +172,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=1, month=5, year=2020): {
-                "sell$LOB": [
+                ("sell", "LOB"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(700),
@@ -186,7 +186,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=1, month=2, year=2021): {
-                "sell$LOB": [
+                ("sell", "LOB"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(400),
@@ -236,7 +236,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=30, month=8, year=2020): {
-                "sell$MSP": [
+                ("sell", "MSP"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(500),
@@ -263,7 +263,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=11, month=9, year=2020): {
-                "buy$MSP": [
+                ("buy", "MSP"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(500),
@@ -328,7 +328,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=2, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(100),
@@ -341,7 +341,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=3, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(154),
@@ -352,7 +352,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal("6781.8"),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(154),
@@ -376,7 +376,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=6, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(90),
@@ -387,7 +387,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal(2525),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(90),
@@ -461,7 +461,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=2, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(100),
@@ -474,7 +474,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=3, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(154),
@@ -485,7 +485,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal("6781.8"),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(154),
@@ -522,7 +522,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=6, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(90),
@@ -533,7 +533,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal(2525),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(90),
@@ -547,7 +547,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=2, month=4, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(30.5),
@@ -620,7 +620,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=2, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(100),
@@ -633,7 +633,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=3, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(154),
@@ -644,7 +644,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal("6781.8"),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(154),
@@ -684,7 +684,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=5, month=3, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(90),
@@ -697,7 +697,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=6, month=3, year=2021): {
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(20.5),
@@ -724,7 +724,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=2, month=4, year=2021): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(30.5),
@@ -781,7 +781,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=25, month=6, year=2023): {
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(30.0),
@@ -795,7 +795,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=30, month=6, year=2023): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(50.0),
@@ -807,7 +807,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal(52468.94),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(50.0),
@@ -882,7 +882,7 @@ calc_basic_data = [
         None,
         {
             datetime.date(day=25, month=6, year=2023): {
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(30.0),
@@ -899,7 +899,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=30, month=6, year=2023): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.SECTION_104,
                         quantity=Decimal(50.0),
@@ -911,7 +911,7 @@ calc_basic_data = [
                         new_pool_cost=Decimal(52468.94),
                     ),
                 ],
-                "sell$FOO": [
+                ("sell", "FOO"): [
                     CalculationEntry(
                         RuleType.SAME_DAY,
                         quantity=Decimal(50.0),
@@ -948,7 +948,7 @@ calc_basic_data = [
                 ],
             },
             datetime.date(day=1, month=7, year=2023): {
-                "buy$FOO": [
+                ("buy", "FOO"): [
                     CalculationEntry(
                         RuleType.BED_AND_BREAKFAST,
                         quantity=Decimal(50.0),
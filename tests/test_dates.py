@@ -0,0 +1,46 @@
+"""Test date helpers."""
+
+import datetime
+
+import pytest
+
+from cgt_calc.dates import parse_slash_date
+
+
+def test_parse_slash_date() -> None:
+    """Test month first and day first slash dates."""
+    assert parse_slash_date("03/04/2021") == datetime.date(2021, 3, 4)
+    assert parse_slash_date("3/4/2021") == datetime.date(2021, 3, 4)
+    assert parse_slash_date("03/04/2021", day_first=True) == datetime.date(2021, 4, 3)
+    assert parse_slash_date("3/4/2021", day_first=True) == datetime.date(2021, 4, 3)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "01/05/20",
+        "01/05/02020",
+        "001/05/2020",
+        "01/005/2020",
+        "1_2/05/2020",
+        " 1/05/2020",
+        "01/05/2020 ",
+        "a/05/2020",
+        "01/05",
+        "01/05/2020/1",
+        "13/05/2020",
+    ],
+)
+def test_parse_slash_date_invalid(date_str: str) -> None:
+    """Test malformed slash dates are rejected like strptime would."""
+    with pytest.raises(ValueError):
+        parse_slash_date(date_str)
+    with pytest.raises(ValueError):
+        datetime.datetime.strptime(date_str, "%m/%d/%Y")
+
+
+@pytest.mark.parametrize("date_str", ["05/13/2020", "05/13/20", "1_2/05/2020"])
+def test_parse_slash_date_invalid_day_first(date_str: str) -> None:
+    """Test malformed day first slash dates are rejected."""
+    with pytest.raises(ValueError):
+        parse_slash_date(date_str, day_first=True)